@@ -28,11 +28,18 @@ import geopandas as gpd
 import cartopy.crs as ccrs
 from cartopy.feature import ShapelyFeature
 import rasterio as rio
-from rasterstats import zonal_stats
+from rasterio.features import rasterize
+from rasterio.windows import Window
 import matplotlib.pyplot as plt
 from ipywidgets import interact
+from IPython.display import display
 import time
 import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# number of states whose vector sources, raster window, label arrays and figures are kept between interact() callbacks
+state_cache_size = 4
 
 def timer(func):
     """Print runtime of decorated function"""
@@ -46,6 +53,40 @@ def timer(func):
         return value
     return wrapper_timer
 
+@functools.lru_cache(maxsize=state_cache_size + 1) # one service areas source per state plus the admin boundaries
+def readVector(fp):
+    """Returns the GeoDataFrame of a vector source, parsed only once per file path.
+
+    Parameters
+    ----------
+    fp : str
+        File path for the vector source.
+
+    Returns
+    ----------
+    gdf : GeoDataFrame
+        GDF of the full vector source. Shared between calls, so copy before modifying.
+    """
+    return gpd.read_file(fp)
+
+@functools.lru_cache(maxsize=4)
+def groupVector(fp, group_field):
+    """Returns the features of a vector source grouped by the values of a column, grouped only once per file path and column.
+
+    Parameters
+    ----------
+    fp : str
+        File path for the vector source.
+    group_field : str
+        The name of the column to group features by.
+
+    Returns
+    ----------
+    groups : dict
+        GDFs of the features for each value of "group_field", keeping the row order of the source.
+    """
+    return dict(tuple(readVector(fp).groupby(group_field)))
+
 def getVector(fp_adm, fp_service_areas, state_name_field, state_select='Lagos'):
     """Returns a subset of vector features and the bounding box (study area).
 
@@ -75,9 +116,10 @@ def getVector(fp_adm, fp_service_areas, state_name_field, state_select='Lagos'):
 
     # load Nigeria Local Government Area boundaries (Level 2, 'ADM2_EN'), and select only those LGAS within the larger Lagos State administrative boundary (Level 1, 'ADM1_EN')
 
-    municipal_all = gpd.read_file(fp_adm)
-    
-    municipal_filter = municipal_all[municipal_all[state_name_field] == state_select]
+    # look up the pre-grouped state rather than comparing the state name of every LGA on each widget event
+    # an unknown state yields an empty GDF, built only on a miss
+    groups = groupVector(fp_adm, state_name_field)
+    municipal_filter = groups[state_select] if state_select in groups else readVector(fp_adm).iloc[:0]
     
     # Somehow feed to interact() for drop-down: state_list = sorted(municipal_all[state_name_field].unique().tolist())
 
@@ -88,12 +130,78 @@ def getVector(fp_adm, fp_service_areas, state_name_field, state_select='Lagos'):
     # LOAD VECTOR DATA FOR SERVICE AREAS OF SOLID WASTE SERVICE PROVIDERS
 
     # service_areas = gpd.read_file(fp_service_areas).to_crs(crs)
-    service_areas = gpd.read_file(fp_service_areas)
+    # shallow copy so that new result columns are not added to the cached GDF
+    service_areas = readVector(fp_service_areas).copy(deep=False)
     
     return municipal_filter, bbox, service_areas
 
+@functools.lru_cache(maxsize=state_cache_size)
+def readPop(fp_raster, bbox, tile_rows=1024):
+    """Returns the population array and affine of the study area, read only once per bounding box.
+
+    Parameters
+    ----------
+    fp_raster : str
+        File path to the HRSL or GWP raster source.
+    bbox : tuple
+        Bounding box of the study area (hashable, so that results can be cached).
+    tile_rows : int, optional
+        Number of rows read and masked at a time, rounded down to a multiple of the raster's block height (the default is 1024).
+
+    Returns
+    ----------
+    pop_array : nd array
+        Read-only float32 array of persons per pixel, with negative NoData values set to 0.
+    affine : Affine
+        Affine transformation for the study area.
+    """
+    # 1. LOAD HIGH RESOLUTION SETTLEMENTS LAYER
+
+    # Continuous floating point raster layer by CIESIN representing number of persons per 30x30m grid cell
+    # Sample: Nigeria
+
+    # size the GDAL block cache (in MB) for a single window read and decompress tiles on all cores
+    with rio.Env(GDAL_CACHEMAX=256, GDAL_NUM_THREADS='ALL_CPUS'), rio.open(fp_raster) as dataset:
+    
+        # create Window object
+        window = dataset.window(*bbox)
+
+        # snap the window outwards to whole pixels (ignoring floating point noise) and clip it to the raster extent,
+        # so that reads never straddle a partial row or column of blocks outside the study area
+        # (the window is built from offsets and lengths, as from_slices() would read negative starts Python-style)
+        (row_start, row_stop), (col_start, col_stop) = np.round(window.toranges(), 6)
+        r0, r1 = int(np.floor(row_start)), int(np.ceil(row_stop))
+        c0, c1 = int(np.floor(col_start)), int(np.ceil(col_stop))
+        window = Window(c0, r0, c1 - c0, r1 - r0).intersection(Window(0, 0, dataset.width, dataset.height))
+
+        # CREATE NUMPY ND ARRAYS
+
+        # load a subset of the HRSL corresponding to the study area as float32 to halve memory footprint and bandwidth
+        height, width = int(window.height), int(window.width)
+        pop_array = np.empty((height, width), dtype='float32')
+        affine = dataset.window_transform(window)
+
+        # align strips to the internal block height of the GeoTIFF so that no block is decompressed twice
+        block_rows = dataset.block_shapes[0][0]
+        tile_rows = max(block_rows, tile_rows // block_rows * block_rows)
+        row_off = int(window.row_off)
+        edges = [0] + list(range(tile_rows - row_off % tile_rows, height, tile_rows)) + [height]
+
+        # read and mask row strips directly into the output array so that no full-size temporary is allocated
+        for start, stop in zip(edges[:-1], edges[1:]):
+            strip = pop_array[start:stop]
+            dataset.read(1, window=Window(window.col_off, row_off + start, width, stop - start), out=strip)
+            np.maximum(strip, 0, out=strip) # sets negative NoData values to 0 in a single pass so they contribute nothing to zonal sums
+
+    # the array is shared between calls, so guard it against in-place modification
+    pop_array.setflags(write=False)
+
+    return pop_array, affine
+
 def computeArray(fp_raster, bbox, sw_ppd):
-    """Returns the nd array, affine and nodata variables required for zonal_stats.
+    """Returns the nd array and affine variables required for the zonal statistics.
+
+    Only the first call for a given study area reads from disk; adjusting the slider merely rescales the cached population array.
 
     Parameters
     ----------
@@ -110,39 +218,128 @@ def computeArray(fp_raster, bbox, sw_ppd):
         Array representing the amount of solid waste produce per pixel per week in metric tonnes.
     affine : Affine
         Affine transformation for the study area.
-    nodata : type depends on raster source
-        The NoData value of the raster source.
     """ 
-    # 1. LOAD HIGH RESOLUTION SETTLEMENTS LAYER
+    # round the bounding box so that it can serve as a stable cache key
+    pop_array, affine = readPop(fp_raster, tuple(np.round(bbox, 6)))
 
-    # Continuous floating point raster layer by CIESIN representing number of persons per 30x30m grid cell
-    # Sample: Nigeria
+    # Calculate tons of solid waste produced per grid cell per week
 
-    with rio.open(fp_raster) as dataset:
-    
-        # read CRS and no data attributes, create Window object
-        crs = dataset.crs
-        nodata = dataset.nodata
-        window = dataset.window(*bbox)
+    # folds kg per person and day, days per week and kg per tonne into a single float32 scalar
+    scale = np.float32(sw_ppd * 7.0 / 1000.0)
 
-        # CREATE NUMPY ND ARRAYS
+    array = pop_array * scale # converts population to tonnes of solid waste per week (TPW)
 
-        # load a subset of the HRSL corresponding to the study area
-        pop_array = dataset.read(1, window=window)
-        affine = dataset.window_transform(window)
-        pop_array[(pop_array < 0)] = np.nan # sets negative NoData values to NaN to enable array algebra
+    return array, affine
+
+# rasterized label arrays of the most recent study areas, keyed by vector source, feature count, shape and affine
+label_cache = {}
+label_cache_size = 2 * state_cache_size # municipalities and service areas of each state
+label_cache_lock = threading.Lock() # zonalStats() rasterizes from two threads
+
+def labelKey(vector, out_shape, affine, key):
+    """Returns the label_cache key of a vector source rasterized onto a study area.
 
-        # Calculate tons of solid waste produced per grid cell rson per week
+    Parameters
+    ----------
+    vector : GeoDataFrame
+        GDF of the polygon features to rasterize.
+    out_shape : tuple
+        Shape of the array of the study area.
+    affine : Affine
+        Affine transformation for the study area.
+    key : hashable
+        Identifies the vector source (e.g. its file path and the selected state).
 
-        sw_ppd_array = pop_array * sw_ppd # converts population to solid waste per person and day
+    Returns
+    ----------
+    cache_key : tuple
+        Key combining "key" with the feature count, shape and affine.
+    """
+    return (key, len(vector), tuple(out_shape), tuple(affine))
 
-        sw_ppw_array = sw_ppd_array * 7 # converts daily to weekly figures
+def rasterizeLabels(vector, out_shape, affine, key=None):
+    """Returns a flattened label array assigning each pixel to the polygon it falls within.
 
-        array = sw_ppw_array / 1000 # converts kilograms to tons per week (TPW)
-        
-        return array, affine, nodata
+    Label arrays depend only on the geometries and the study area, not on the slider, so they are cached when a key is given.
 
-def zonalStats(municipal_filter, service_areas, array, affine, nodata, stat_select, mun_name_field, provider_name_field):
+    Parameters
+    ----------
+    vector : GeoDataFrame
+        GDF of the polygon features to rasterize.
+    out_shape : tuple
+        Shape of the array of the study area.
+    affine : Affine
+        Affine transformation for the study area.
+    key : hashable, optional
+        Identifies the vector source (e.g. its file path and the selected state). Labels are not cached if omitted (the default is None).
+
+    Returns
+    ----------
+    labels : ndarray
+        Read-only flattened array of 0 (outside all polygons) or i+1 for the i-th feature of "vector".
+    """
+
+    if key is not None:
+        key = labelKey(vector, out_shape, affine, key)
+        with label_cache_lock:
+            if key in label_cache:
+                return label_cache[key]
+
+    # int16 labels halve the memory held in the cache for all but the largest vector sources (bincount still converts
+    # each strip to intp, so there is no gain in bandwidth)
+    dtype = np.int16 if len(vector) < np.iinfo(np.int16).max else np.int32
+
+    # burn each polygon into a label raster (0 = outside all polygons, i+1 = i-th feature)
+    labels = rasterize(((geom, i + 1) for i, geom in enumerate(vector.geometry)), out_shape=out_shape, transform=affine, fill=0, all_touched=False, dtype=dtype).ravel()
+    labels.setflags(write=False)
+
+    if key is not None:
+        with label_cache_lock:
+            # evict the oldest entry (dicts preserve insertion order)
+            if len(label_cache) >= label_cache_size:
+                label_cache.pop(next(iter(label_cache)))
+            label_cache[key] = labels
+
+    return labels
+
+def labelSums(vector, array, affine, key=None, tile_rows=1024):
+    """Returns the sum of array values falling within each polygon of a vector source.
+
+    Each pixel is assigned to a single polygon, so the polygons are assumed not to overlap: pixels covered by several polygons only count towards the last of them.
+
+    Parameters
+    ----------
+    vector : GeoDataFrame
+        GDF of the polygon features for which zonal sums are computed.
+    array : nd array
+        Array representing the amount of solid waste produce per pixel per week in metric tonnes.
+    affine : Affine
+        Affine transformation for the study area.
+    key : hashable, optional
+        Passed to rasterizeLabels() to cache the label array (the default is None).
+    tile_rows : int, optional
+        Number of rows summed at a time (the default is 1024).
+
+    Returns
+    ----------
+    stats : ndarray
+        Zonal sums in the same order as the rows of "vector".
+    """
+
+    labels = rasterizeLabels(vector, array.shape, affine, key)
+
+    # sum all pixel values per label in a single pass over row strips, so that bincount() only ever
+    # converts one strip of weights to float64, and drop the background bin
+    flat = array.ravel()
+    step = tile_rows * array.shape[1]
+    totals = np.zeros(len(vector) + 1)
+    for start in range(0, flat.size, step):
+        totals += np.bincount(labels[start:start + step], weights=flat[start:start + step], minlength=len(vector) + 1)
+    stats = totals[1:]
+
+    return stats
+
+def zonalStats(municipal_filter, service_areas, array, affine, mun_name_field, provider_name_field, cache_key=None):
         """Returns one list each of feature names and zonal statistics.
         
         Parameters
@@ -155,14 +352,12 @@ def zonalStats(municipal_filter, service_areas, array, affine, nodata, stat_sele
             Array representing the amount of solid waste produce per pixel per week in metric tonnes.
         affine : Affine
             Affine transformation for the study area.
-        nodata : type depends on raster source
-            The NoData value of the raster source.
-        stat_select : str
-            The statistic to be computed (default is 'sum')
         mun_name_field : str
             The name of the column containing the names of subordinate jurisdictions.
         provider_name_field : str
             The name of the column containing the names of service providers.
+        cache_key : hashable, optional
+            Identifies the selected state and service areas source so that label arrays are reused across slider ticks (the default is None).
         
         Returns
         ----------
@@ -176,58 +371,31 @@ def zonalStats(municipal_filter, service_areas, array, affine, nodata, stat_sele
             List of zonal statistics for service providers.
         """
 
-        def getNamesStats(vector, array, name_field, feature_list, stat_list, stat_select='sum'):
-            """Returns one list each of feature names and zonal statistics.
-
-            Parameters
-            ----------
-            vector : path to a vector source or geo-like python object
-                Python object can be a GeoPandas GeoDataFrame.
-            raster : ndarray
-                rasterstats alternative arg, 'path to a GDAL raster', not accepted.   
-            name_field : str
-                The vector source's column name containing feature names.
-            feature_list : str
-                Temp variable name for feature list. Must be unique in script as run consecutively.
-            stat_list : str
-                Temp variable name for statistics list. Must be unique in script.
-            stat_select : str, optional
-                String value for any statistic supported by zonal_stats (the default is 'sum').
-
-            Returns
-            ----------
-            feature_list : list
-                A list in alphabetical order containing the names of polygon features for which zonal stats are computed.
-            stat_list : list
-                A list containing the zonal statistics in the same order as "feature_list".
-            """
-
-            temp = zonal_stats(vector, array, affine=affine, nodata=nodata, stats=stat_select, geojson_out=True)
-
-            for feature_dict in temp:
-                feature_name = feature_dict['properties'][name_field]
-                feature_stat = feature_dict['properties'][stat_select]
-                feature_list.append(feature_name)
-                stat_list.append(feature_stat)
-
-        # CALCULATE ZONAL STATS - BASELINE GENERATION PER MUNICIPALITY
-
-        # empty lists of all polygon names and zonal stats to be populated by function
-
-        mun_names = []
-        mun_stats = []
-        getNamesStats(municipal_filter, array, mun_name_field, mun_names, mun_stats)
-
-        # CALCULATE ZONAL STATS - SOLID WASTE COLLECTED PER SERVICE AREA
-
-        provider_names = []
-        provider_stats = []
-        getNamesStats(service_areas, array, provider_name_field, provider_names, provider_stats)
+        # CALCULATE ZONAL STATS - BASELINE GENERATION PER MUNICIPALITY AND SOLID WASTE COLLECTED PER SERVICE AREA
+
+        mun_names = municipal_filter[mun_name_field].tolist()
+        provider_names = service_areas[provider_name_field].tolist()
+
+        passes = [(municipal_filter, ('municipalities', cache_key) if cache_key is not None else None),
+                  (service_areas, ('service_areas', cache_key) if cache_key is not None else None)]
+
+        with label_cache_lock:
+            cached = all(key is not None and labelKey(vector, array.shape, affine, key) in label_cache for vector, key in passes)
+
+        if cached:
+            # slider tick: both label arrays are cached, so only two short bincount loops remain
+            mun_stats, provider_stats = (labelSums(vector, array, affine, key).tolist() for vector, key in passes)
+        else:
+            # new study area: the two rasterize passes are independent, so they are submitted to threads
+            # (this only overlaps them where GDAL runs without holding the GIL)
+            with ThreadPoolExecutor(2) as executor:
+                futures = [executor.submit(labelSums, vector, array, affine, key) for vector, key in passes]
+                mun_stats, provider_stats = (future.result().tolist() for future in futures)
 
         return mun_names, mun_stats, provider_names, provider_stats
 
 def processStats(service_areas, mun_names, mun_stats, provider_names, provider_stats, provider_coll_field):
-        """Prints two rank-ordered lists and returns two lists of ordered tuples.
+        """Prints two rank-ordered lists and returns two lists of ordered tuples and the uncollected totals.
 
         Parameters
         ----------
@@ -250,35 +418,51 @@ def processStats(service_areas, mun_names, mun_stats, provider_names, provider_s
             List of name-stat tuples for subordinate jurisdictions.
         provider_dict_sorted : list
             List of name-stat tuples for service providers.
+        provider_uncoll : ndarray
+            Total uncollected solid waste per week for each service provider, in the order of "service_areas".
         """
 
         # extract total collection values and subtract the total waste generated in each service area
 
-        provider_coll = service_areas[provider_coll_field].values.tolist()
-        zip_object = zip(provider_stats, provider_coll)
-
-        provider_uncoll = []
-        for i, j in zip_object:
-            provider_uncoll.append(i - j)
+        provider_uncoll = np.asarray(provider_stats, dtype=np.float64) - service_areas[provider_coll_field].to_numpy(dtype=np.float64)
 
         # ORGANISE AND PRINT RESULTS
 
-        # combine populated lists into dictionaries
-        mun_dict = dict(zip(mun_names, mun_stats))
-        provider_dict = dict(zip(provider_names, provider_uncoll))
+        # sort by value in descending order into list of tuples (argsort in C, then gather the names)
+        mun_arr = np.asarray(mun_stats, dtype=float)
+        mun_order = np.argsort(-mun_arr, kind='stable')
+        mun_dict_sorted = list(zip([mun_names[i] for i in mun_order], mun_arr[mun_order].tolist()))
 
-        # sort dictionaries by value in descending order into list of tuples
-        mun_dict_sorted = sorted(mun_dict.items(), key=lambda x: x[1], reverse=True)
-        provider_dict_sorted = sorted(provider_dict.items(), key=lambda x: x[1], reverse=True)
+        provider_order = np.argsort(-provider_uncoll, kind='stable')
+        provider_dict_sorted = list(zip([provider_names[i] for i in provider_order], provider_uncoll[provider_order].tolist()))
 
-        # print the items in the sorted list of tuples
+        # print the items in the sorted list of tuples, one print call per list
         print('Municipalities by solid waste generated per week (descending):\n')
-        [print(i[0],':',f"{int(i[1]):,}", 'tonnes') for i in mun_dict_sorted]
+        print('\n'.join(f'{n} : {int(v):,} tonnes' for n, v in mun_dict_sorted))
 
         print('\nService providers by total uncollected solid waste per week (descending)\n')
-        [print(i[0],':',f"{int(i[1]):,}", 'tonnes') for i in provider_dict_sorted]
+        print('\n'.join(f'{n} : {int(v):,} tonnes' for n, v in provider_dict_sorted))
+
+        return mun_dict_sorted, provider_dict_sorted, provider_uncoll
+
+def countParts(vector):
+    """Returns the number of polygons making up each feature of a vector source.
+
+    Parameters
+    ----------
+    vector : GeoDataFrame
+        GDF of the polygon features.
 
-        return mun_dict_sorted, provider_dict_sorted
+    Returns
+    ----------
+    parts : ndarray
+        1 for each Polygon and the number of parts for each MultiPolygon, in the order of the rows of "vector".
+    """
+    return np.array([len(geom.geoms) if geom.geom_type == 'MultiPolygon' else 1 for geom in vector.geometry])
+
+# the figures and artists of the most recently plotted states, keyed by state and service areas source
+plot_cache = {}
+plot_cache_size = state_cache_size
 
 @timer
 def main(state_list='Lagos', sw_ppd=(0.4, 1.2, 0.1)): 
@@ -316,21 +500,21 @@ def main(state_list='Lagos', sw_ppd=(0.4, 1.2, 0.1)):
 
     # OPTIONAL CUSTOMIZATIONS
 
-    # the rasterstats zonal statistic to be computed for each jurisdiction (default is 'sum')
-    stat_select = 'sum' 
-
-    # If adjusting 'stat_select', also adjust the title of the choropleth maps accordingly
+    # If adjusting the array algebra, also adjust the title of the choropleth maps accordingly
     var_name = 'Tonnes of solid waste generated per week'
     
     # EXECUTE FUNCTIONS
 
     municipal_filter, bbox, service_areas = getVector(fp_adm, fp_service_areas, state_name_field, state_select)
 
-    array, affine, nodata = computeArray(fp_raster, bbox, sw_ppd)
+    array, affine = computeArray(fp_raster, bbox, sw_ppd)
+
+    mun_names, mun_stats, provider_names, provider_stats = zonalStats(municipal_filter, service_areas, array, affine, mun_name_field, provider_name_field, cache_key=(state_select, fp_service_areas))
 
-    mun_names, mun_stats, provider_names, provider_stats = zonalStats(municipal_filter, service_areas, array, affine, nodata, stat_select, mun_name_field, provider_name_field)
+    # the raster subset is no longer needed, so free it before plotting allocates its own buffers
+    del array
 
-    mun_dict_sorted, provider_dict_sorted = processStats(service_areas, mun_names, mun_stats, provider_names, provider_stats, provider_coll_field)
+    mun_dict_sorted, provider_dict_sorted, provider_uncoll = processStats(service_areas, mun_names, mun_stats, provider_names, provider_stats, provider_coll_field)
 
     # UPDATE GEODATAFRAMES WITH RESULTS
     
@@ -342,22 +526,59 @@ def main(state_list='Lagos', sw_ppd=(0.4, 1.2, 0.1)):
             stat_output = pd.Series(mun_stats, index = municipal_filter.index)
     )
 
-    for i, row in service_areas.iterrows():
-            service_areas.loc[i, 'total_uncoll'] = provider_stats[i] - row[provider_coll_field]
+    # reuse the totals printed by processStats() so that the map and the list show the same values
+    service_areas['total_uncoll'] = provider_uncoll
     
     # PLOT RESULTS ON CHOROPLETH MAPS
-    
+
+    vmin, vmax =  municipal_filter['stat_output'].min(), municipal_filter['stat_output'].max()
+    vmin2, vmax2 =  service_areas['total_uncoll'].min(), service_areas['total_uncoll'].max()
+    annotation = 'Source: CIESIN HRSL, assuming ' + str(sw_ppd) + 'kg of solid waste per capita per day'
+
+    # geometries only change with the state, so for a state that has been plotted before only the values, color limits
+    # and annotation of its existing figure are swapped instead of rebuilding axes, colorbars and patches
+    plot_key = (state_select, fp_service_areas)
+    if plot_key in plot_cache:
+        # move the entry to the end so that the least recently used state is evicted first
+        cached = plot_cache[plot_key] = plot_cache.pop(plot_key)
+
+        cached['pc1'].set_array(np.repeat(municipal_filter['stat_output'].to_numpy(), cached['parts1']))
+        cached['pc2'].set_array(np.repeat(service_areas['total_uncoll'].to_numpy(), cached['parts2']))
+
+        for artist in ('pc1', 'sm1'):
+            cached[artist].set_clim(vmin, vmax)
+        for artist in ('pc2', 'sm2'):
+            cached[artist].set_clim(vmin2, vmax2)
+
+        cached['annotation'].set_text(annotation)
+
+        fig = cached['fig']
+
+        # interact() clears its output before every callback, so the figure is always displayed again: the canvas
+        # widget while it is still open (e.g. ipympl), or the figure itself once the inline backend has closed it
+        if plt.fignum_exists(fig.number):
+            fig.canvas.draw_idle()
+            display(fig.canvas)
+        else:
+            display(fig)
+
+        return
+
     # Define figure CRS and canvas layout
 
     myCRS = ccrs.Mercator()
 
+    # project geometries to the figure CRS once per figure, and reuse them on both subplots
+    mun_plot = municipal_filter.to_crs(myCRS.proj4_init)
+    service_plot = service_areas.to_crs(myCRS.proj4_init)
+
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 7.5), subplot_kw=dict(projection=myCRS))
 
     # --Subplot 1-- 
     
     # add municipal boundaries
 
-    municipal_feat = ShapelyFeature(municipal_filter['geometry'], myCRS, facecolor='none', edgecolor='k', linewidth=0.5)
+    municipal_feat = ShapelyFeature(mun_plot['geometry'], myCRS, facecolor='none', edgecolor='k', linewidth=0.5)
     ax1.add_feature(municipal_feat)
 
     # add dynamic title and annotation
@@ -366,16 +587,16 @@ def main(state_list='Lagos', sw_ppd=(0.4, 1.2, 0.1)):
 
     ax1.axis('off')
 
-    ax1.annotate('Source: CIESIN HRSL, assuming ' + str(sw_ppd) + 'kg of solid waste per capita per day', xy=(0.225, .025), xycoords='figure fraction', fontsize=12, color='#555555')
+    annotation_text = ax1.annotate(annotation, xy=(0.225, .025), xycoords='figure fraction', fontsize=12, color='#555555')
 
     # create colorbar legend
-    vmin, vmax =  municipal_filter['stat_output'].min(), municipal_filter['stat_output'].max()
-    sm = plt.cm.ScalarMappable(cmap='Blues', norm=plt.Normalize(vmin=vmin, vmax=vmax))
-    sm.set_array([])
+    sm1 = plt.cm.ScalarMappable(cmap='Blues', norm=plt.Normalize(vmin=vmin, vmax=vmax))
+    sm1.set_array([])
 
-    fig.colorbar(sm, ax=ax1, orientation="horizontal")
+    fig.colorbar(sm1, ax=ax1, orientation="horizontal")
     
-    municipal_filter.plot(column='stat_output', cmap='Blues', linewidth=0.8, ax=ax1, edgecolor='0.8')
+    mun_plot.plot(column='stat_output', cmap='Blues', linewidth=0.8, ax=ax1, edgecolor='0.8')
+    pc1 = ax1.collections[-1]
 
     # --Sub-plot 2--
 
@@ -386,15 +607,27 @@ def main(state_list='Lagos', sw_ppd=(0.4, 1.2, 0.1)):
     ax2.axis('off')
 
     # Create colorbar legend
-    vmin2, vmax2 =  service_areas['total_uncoll'].min(), service_areas['total_uncoll'].max()
-    sm = plt.cm.ScalarMappable(cmap='Reds', norm=plt.Normalize(vmin=vmin2, vmax=vmax2))
-    sm.set_array([])
+    sm2 = plt.cm.ScalarMappable(cmap='Reds', norm=plt.Normalize(vmin=vmin2, vmax=vmax2))
+    sm2.set_array([])
+
+    fig.colorbar(sm2, ax=ax2, orientation="horizontal")
+
+    mun_plot.plot(facecolor='none', linewidth=0.5, ax=ax2, edgecolor='k')
+
+    service_plot.plot(column='total_uncoll', cmap='Reds', linewidth=0.8, ax=ax2, edgecolor='k')
+    pc2 = ax2.collections[-1]
 
-    fig.colorbar(sm, ax=ax2, orientation="horizontal")
+    # CACHE FIGURE FOR SUBSEQUENT SLIDER TICKS
 
-    municipal_filter.plot(facecolor='none', linewidth=0.5, ax=ax2, edgecolor='k')
+    # GeoPandas draws one patch per part of a MultiPolygon, so values are repeated per part when updating
+    parts1 = countParts(mun_plot)
+    parts2 = countParts(service_plot)
 
-    service_areas.plot(column='total_uncoll', cmap='Reds', linewidth=0.8, ax=ax2, edgecolor='k')
+    if len(pc1.get_array()) == parts1.sum() and len(pc2.get_array()) == parts2.sum():
+        # evict and close the least recently used figure
+        if len(plot_cache) >= plot_cache_size:
+            plt.close(plot_cache.pop(next(iter(plot_cache)))['fig'])
+        plot_cache[plot_key] = dict(fig=fig, pc1=pc1, pc2=pc2, sm1=sm1, sm2=sm2, parts1=parts1, parts2=parts2, annotation=annotation_text)
 
 if __name__ == "__main__":
 
@@ -409,7 +642,7 @@ if __name__ == "__main__":
     state_name_field = 'ADM1_EN'
 
     # variables declared to be passed to interact()
-    municipal_all = gpd.read_file(fp_adm)
+    municipal_all = readVector(fp_adm)
     state_list = sorted(municipal_all[state_name_field].unique().tolist())
 
     interact(main, state_list=state_list)